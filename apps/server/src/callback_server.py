@@ -1,154 +1,195 @@
 """HTTP callback server for OAuth redirect handling."""
 
 import asyncio
-from http.server import BaseHTTPRequestHandler, HTTPServer
-from urllib.parse import urlparse, parse_qs
-from typing import Optional, Callable
-import threading
-
-
-class CallbackHandler(BaseHTTPRequestHandler):
-    """HTTP request handler for OAuth callbacks."""
-    
-    callback_function: Optional[Callable] = None
-    
-    def log_message(self, format, *args):
-        """Suppress default logging."""
-        pass
-    
-    def do_GET(self):
-        """Handle GET request (OAuth callback)."""
-        parsed_url = urlparse(self.path)
-        query_params = parse_qs(parsed_url.query)
-        
-        # Extract authorization code and state
-        code = query_params.get('code', [None])[0]
-        state = query_params.get('state', [None])[0]
-        error = query_params.get('error', [None])[0]
-        
-        if error:
-            # OAuth error
-            self.send_response(400)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            html = f"""
-            <html>
-            <head><title>Authorization Failed</title></head>
-            <body>
-                <h1>Authorization Failed</h1>
-                <p>Error: {error}</p>
-                <p>You can close this window.</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode())
-            
-            if self.callback_function:
-                self.callback_function(None, None, error)
-        
-        elif code:
-            # Success - got authorization code
-            self.send_response(200)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            html = """
-            <html>
-            <head><title>Authorization Successful</title></head>
-            <body>
-                <h1>Authorization Successful!</h1>
-                <p>You can close this window and return to your application.</p>
-                <script>window.close();</script>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode())
-            
-            if self.callback_function:
-                self.callback_function(code, state, None)
-        
-        else:
-            # No code or error - invalid request
-            self.send_response(400)
-            self.send_header('Content-type', 'text/html')
-            self.end_headers()
-            html = """
-            <html>
-            <head><title>Invalid Request</title></head>
-            <body>
-                <h1>Invalid Request</h1>
-                <p>Missing authorization code.</p>
-            </body>
-            </html>
-            """
-            self.wfile.write(html.encode())
+import socket
+from urllib.parse import urlsplit, unquote_plus
+from typing import Optional
+
+# The only query fields the OAuth redirect can carry that we care about.
+_CALLBACK_KEYS = frozenset(("code", "state", "error"))
+
+
+def _extract_params(query: str) -> dict:
+    """
+    Extract code/state/error from a raw query string.
+
+    Cheaper than parse_qs for this fixed three-field case: one split, one
+    partition per pair, and values are unquoted only when the key matches.
+
+    Args:
+        query: Raw query string from the redirect URL
+
+    Returns:
+        Dictionary with 'code', 'state', and 'error' keys (values may be None)
+    """
+    found = {"code": None, "state": None, "error": None}
+    if query:
+        for pair in query.split("&"):
+            key, sep, value = pair.partition("=")
+            if sep and key in _CALLBACK_KEYS:
+                found[key] = unquote_plus(value)
+    return found
+
+
+def _build_response(status: str, body: bytes) -> bytes:
+    """Assemble a full pre-encoded HTTP/1.1 response for a static body."""
+    return (
+        f"HTTP/1.1 {status}\r\n"
+        f"Content-Type: text/html\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n"
+    ).encode() + body
+
+
+_OK_BODY = b"""
+<html>
+<head><title>Authorization Successful</title></head>
+<body>
+    <h1>Authorization Successful!</h1>
+    <p>You can close this window and return to your application.</p>
+    <script>window.close();</script>
+</body>
+</html>
+"""
+
+_ERROR_BODY_TEMPLATE = b"""
+<html>
+<head><title>Authorization Failed</title></head>
+<body>
+    <h1>Authorization Failed</h1>
+    <p>Error: {error}</p>
+    <p>You can close this window.</p>
+</body>
+</html>
+"""
+
+_INVALID_BODY = b"""
+<html>
+<head><title>Invalid Request</title></head>
+<body>
+    <h1>Invalid Request</h1>
+    <p>Missing authorization code.</p>
+</body>
+</html>
+"""
+
+# Responses with static bodies are fully pre-built, headers included, so the
+# common paths write a single pre-encoded buffer.
+_OK_RESPONSE = _build_response("200 OK", _OK_BODY)
+_INVALID_RESPONSE = _build_response("400 Bad Request", _INVALID_BODY)
 
 
 class OAuthCallbackServer:
-    """Simple HTTP server for OAuth callback handling."""
-    
+    """Single-shot asyncio HTTP server for OAuth callback handling.
+
+    Runs on the already-running event loop instead of spawning a dedicated
+    thread with the blocking ``http.server`` stack. Exactly one redirect is
+    expected, so the handler is a tiny hand-rolled HTTP/1.1 responder.
+    """
+
     def __init__(self, host: str = "localhost", port: int = 8477):
         """
         Initialize callback server.
-        
+
         Args:
             host: Host to bind to
             port: Port to listen on
         """
         self.host = host
         self.port = port
-        self.server: Optional[HTTPServer] = None
-        self.server_thread: Optional[threading.Thread] = None
-        self.callback_data: dict = {}
-        self.callback_received = threading.Event()
-    
-    def _handle_callback(self, code: Optional[str], state: Optional[str], error: Optional[str]):
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._callback_future: Optional[asyncio.Future] = None
+
+    async def start(self) -> None:
+        """Start the callback server on the current event loop."""
+        loop = asyncio.get_running_loop()
+        self._callback_future = loop.create_future()
+        # reuse_address lets a retried OAuth flow rebind the port immediately
+        # instead of failing for the TIME_WAIT window of the previous attempt.
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port, reuse_address=True
+        )
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
         """
-        Internal callback handler.
-        
+        Handle a single HTTP connection (the OAuth redirect).
+
         Args:
-            code: Authorization code
-            state: State parameter
-            error: Error message if any
+            reader: Stream reader for the connection
+            writer: Stream writer for the connection
         """
-        self.callback_data = {
-            "code": code,
-            "state": state,
-            "error": error
-        }
-        self.callback_received.set()
-    
-    def start(self) -> None:
-        """Start the callback server in a background thread."""
-        CallbackHandler.callback_function = self._handle_callback
-        
-        self.server = HTTPServer((self.host, self.port), CallbackHandler)
-        self.server_thread = threading.Thread(target=self.server.serve_forever)
-        self.server_thread.daemon = True
-        self.server_thread.start()
-    
-    def wait_for_callback(self, timeout: float = 300.0) -> dict:
+        # Disable Nagle so the single response write is not delayed.
+        sock = writer.transport.get_extra_info("socket")
+        if sock is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+
+        try:
+            # Read the request headers; the callback carries no body.
+            request = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            writer.close()
+            return
+
+        # Request line looks like: GET /callback?code=...&state=... HTTP/1.1
+        request_line = request.split(b"\r\n", 1)[0].decode("latin-1")
+        parts = request_line.split(" ")
+        path = parts[1] if len(parts) >= 2 else "/"
+
+        # Extract authorization code and state
+        params = _extract_params(urlsplit(path).query)
+        code = params["code"]
+        state = params["state"]
+        error = params["error"]
+
+        if error:
+            # OAuth error - only this path needs per-request formatting
+            body = _ERROR_BODY_TEMPLATE.replace(b"{error}", error.encode())
+            response = _build_response("400 Bad Request", body)
+        elif code:
+            # Success - got authorization code
+            response = _OK_RESPONSE
+        else:
+            # No code or error - invalid request
+            response = _INVALID_RESPONSE
+
+        writer.write(response)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+        if self._callback_future and not self._callback_future.done() and (code or error):
+            self._callback_future.set_result({
+                "code": code,
+                "state": state,
+                "error": error
+            })
+
+    async def wait_for_callback(self, timeout: float = 300.0) -> dict:
         """
         Wait for OAuth callback to be received.
-        
+
         Args:
             timeout: Timeout in seconds (default 5 minutes)
-        
+
         Returns:
             Dictionary containing code, state, and error
-        
+
         Raises:
             TimeoutError: If callback not received within timeout
         """
-        if self.callback_received.wait(timeout):
-            return self.callback_data
-        else:
+        try:
+            return await asyncio.wait_for(self._callback_future, timeout)
+        except asyncio.TimeoutError:
             raise TimeoutError("OAuth callback not received within timeout period")
-    
+
     def stop(self) -> None:
         """Stop the callback server."""
-        if self.server:
-            self.server.shutdown()
-            self.server.server_close()
-        if self.server_thread:
-            self.server_thread.join(timeout=5)
-
+        if self._server:
+            self._server.close()
+            self._server = None
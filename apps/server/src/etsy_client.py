@@ -1,16 +1,505 @@
 """Etsy API client wrapper for making authenticated requests."""
 
 import os
+import functools
+import random
+import time
 import httpx
+import orjson
+from collections import OrderedDict
 from typing import Any, Dict, Optional
+from urllib.parse import quote_from_bytes
 import asyncio
 
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+# msgspec is optional: when installed, hot callers can decode listing pages
+# straight into typed structs and skip materializing nested dicts.
+try:
+    import msgspec
+
+    class Listing(msgspec.Struct, frozen=True):
+        """Subset of listing fields bulk consumers read."""
+        listing_id: int
+        title: str
+        state: str
+        price: dict
+
+    class ShopListingsPage(msgspec.Struct):
+        """Typed shape of a get_shop_listings page."""
+        count: int
+        results: list[Listing]
+
+    _LISTINGS_DECODER = msgspec.json.Decoder(ShopListingsPage)
+except ImportError:
+    msgspec = None
+    _LISTINGS_DECODER = None
+
+
+def get_shared_async_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide AsyncClient used for all Etsy HTTP traffic.
+
+    Other modules (e.g. the OAuth token exchange) should use this instead of
+    constructing throwaway clients, so the whole process shares one warm
+    connection pool.
+    """
+    return EtsyClient._get_shared_client()
+
+
+_FORM_SAFE = b"-_.~"
+
+
+def _encode_form(data: Dict[str, Any]) -> bytes:
+    """
+    Encode a flat dict as application/x-www-form-urlencoded bytes.
+
+    Bypasses httpx's per-call form handling while keeping its conventions:
+    booleans become 'true'/'false' and lists become repeated fields.
+
+    Args:
+        data: Field names mapped to scalar values or lists of scalars.
+
+    Returns:
+        The encoded request body as bytes.
+    """
+    parts = []
+    for key, value in data.items():
+        encoded_key = quote_from_bytes(str(key).encode(), _FORM_SAFE)
+        values = value if isinstance(value, (list, tuple)) else (value,)
+        for item in values:
+            if isinstance(item, bool):
+                item = "true" if item else "false"
+            parts.append(
+                encoded_key + "=" + quote_from_bytes(str(item).encode(), _FORM_SAFE)
+            )
+    return "&".join(parts).encode()
+
+
+# Constant single-field bodies, picked instead of re-encoded per call.
+_IS_WORKING_TRUE = b"is_working=true"
+_IS_WORKING_FALSE = b"is_working=false"
+_CONSOLIDATE_BODY = b"source_return_policy_id=%s&destination_return_policy_id=%s"
+
+
+def _csv_ids(ids) -> str:
+    """Serialize an id sequence into the comma-separated form Etsy expects."""
+    return ",".join(map(str, ids))
+
+
+def _p(**kwargs: Any) -> Dict[str, Any]:
+    """Build a params or form dict from keyword arguments, dropping Nones."""
+    return {k: v for k, v in kwargs.items() if v is not None}
+
+
+def _parse(response: httpx.Response) -> Any:
+    """
+    Fused status check + body decode for a completed response.
+
+    Checks the status code inline and decodes response.content once with
+    orjson, instead of a raise_for_status() pass followed by a separate
+    .json() pass over the same response.
+
+    Args:
+        response: A fully-read httpx response.
+
+    Returns:
+        Parsed JSON body, or None when the body is empty.
+
+    Raises:
+        httpx.HTTPStatusError: For 4xx/5xx responses.
+    """
+    if response.status_code >= 400:
+        raise httpx.HTTPStatusError(
+            f"HTTP {response.status_code} for {response.url}",
+            request=response.request,
+            response=response,
+        )
+    content = response.content
+    return orjson.loads(content) if content else None
+
+
+def _async_ttl_cache(maxsize: int = 128, ttl: float = 60.0):
+    """
+    Memoize an async method per instance with an LRU + TTL policy.
+
+    Results are stored as asyncio Tasks keyed by method name and arguments,
+    so concurrent callers of the same endpoint await a single in-flight
+    request instead of each paying their own round trip. Failed tasks are
+    evicted so errors are not cached.
+
+    Args:
+        maxsize: Maximum number of cached entries per instance.
+        ttl: Seconds a cached result stays valid.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache = self._ttl_cache
+            key = (func.__name__, args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            entry = cache.get(key)
+            if entry is not None:
+                task, created = entry
+                failed = task.cancelled() or (
+                    task.done() and task.exception() is not None
+                )
+                if (now - created) < ttl and not failed:
+                    cache.move_to_end(key)
+                    return await task
+                del cache[key]
+            task = asyncio.ensure_future(func(self, *args, **kwargs))
+            cache[key] = (task, now)
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            try:
+                return await task
+            except BaseException:
+                cache.pop(key, None)
+                raise
+        return wrapper
+    return decorator
+
+
+def _requests_per_second() -> float:
+    """Outbound request budget, configurable via the ETSY_RPM env var."""
+    try:
+        rpm = float(os.getenv("ETSY_RPM", "600"))
+    except ValueError:
+        rpm = 600.0
+    return max(rpm, 1.0) / 60.0
+
+
+class _TokenBucket:
+    """
+    Async token bucket smoothing outbound request rate.
+
+    Tokens refill continuously at `rate` per second up to `capacity`;
+    acquire() sleeps just long enough when the bucket runs dry, flattening
+    bursts to Etsy's rate budget instead of letting them turn into 429s.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Block until `tokens` tokens are available, then consume them."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + (now - self.last_refill) * self.rate,
+                )
+                self.last_refill = now
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self.tokens) / self.rate)
+
+
+# Transient statuses worth retrying; 429 is safe for any verb because the
+# server rejected the request before processing it.
+_RETRYABLE_STATUS = frozenset((408, 429, 500, 502, 503, 504))
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE"))
+
+
+class _RateLimitedTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper metering every outbound request through a bucket.
+
+    Sitting at the transport level covers all verbs and helpers in one
+    place, including the OAuth flow that shares this client. Transient
+    throttling and server errors are retried here with exponential backoff
+    plus full jitter, honouring Retry-After when the server sends one.
+    """
+
+    _MAX_ATTEMPTS = 4
+    _BACKOFF_CAP = 30.0
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, bucket: _TokenBucket):
+        self._inner = inner
+        self._bucket = bucket
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        for attempt in range(self._MAX_ATTEMPTS):
+            await self._bucket.acquire()
+            response = await self._inner.handle_async_request(request)
+            if (
+                attempt == self._MAX_ATTEMPTS - 1
+                or response.status_code not in _RETRYABLE_STATUS
+            ):
+                return response
+            # Only 429 is known-unprocessed; replaying a failed POST/PATCH
+            # after a 5xx could double-apply the write.
+            if response.status_code != 429 and request.method not in _IDEMPOTENT_METHODS:
+                return response
+            delay = random.uniform(0.0, min(0.5 * 2 ** attempt, self._BACKOFF_CAP))
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    delay = max(delay, float(retry_after))
+                except ValueError:
+                    pass
+            await response.aread()
+            await response.aclose()
+            await asyncio.sleep(delay)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _ShippingProfileSession:
+    """
+    Buffered write session for one shipping profile.
+
+    Queues destination/upgrade writes instead of awaiting each one, then
+    flushes the batch concurrently, so rebuilding a profile costs roughly
+    one round trip per `concurrency` writes instead of one per write.
+    Entered via EtsyClient.shipping_profile_session().
+    """
+
+    def __init__(
+        self,
+        client: "EtsyClient",
+        shop_id: str,
+        shipping_profile_id: str,
+        concurrency: int = 8,
+    ):
+        self._client = client
+        self.shop_id = shop_id
+        self.shipping_profile_id = shipping_profile_id
+        self._concurrency = concurrency
+        self._pending: list = []
+        self.results: list = []
+
+    def add_destination(self, **fields) -> None:
+        """Queue a create_shipping_profile_destination call."""
+        self._pending.append(
+            (self._client.create_shipping_profile_destination, (), fields)
+        )
+
+    def update_destination(self, destination_id: str, **fields) -> None:
+        """Queue an update_shipping_profile_destination call."""
+        self._pending.append(
+            (
+                self._client.update_shipping_profile_destination,
+                (destination_id,),
+                fields,
+            )
+        )
+
+    def add_upgrade(self, **fields) -> None:
+        """Queue a create_shipping_profile_upgrade call."""
+        self._pending.append(
+            (self._client.create_shipping_profile_upgrade, (), fields)
+        )
+
+    def update_upgrade(self, upgrade_id: str, **fields) -> None:
+        """Queue an update_shipping_profile_upgrade call."""
+        self._pending.append(
+            (self._client.update_shipping_profile_upgrade, (upgrade_id,), fields)
+        )
+
+    async def flush(self) -> list:
+        """
+        Dispatch every queued write concurrently and collect the results.
+
+        Returns:
+            Results for this batch in queue order; failed entries hold the
+            raised exception instead of a result dict.
+        """
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+        sem = asyncio.Semaphore(self._concurrency)
+
+        async def run(method, extra, fields):
+            async with sem:
+                return await method(
+                    self.shop_id, self.shipping_profile_id, *extra, **fields
+                )
+
+        batch = await asyncio.gather(
+            *[run(m, a, f) for m, a, f in pending], return_exceptions=True
+        )
+        self.results.extend(batch)
+        return list(batch)
+
+    async def __aenter__(self) -> "_ShippingProfileSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        # Flush only on clean exit; an exception inside the block means the
+        # queued writes are no longer wanted.
+        if exc_type is None:
+            await self.flush()
+
+
+class _ListingLoader:
+    """
+    Tick-scoped batcher for single-listing lookups.
+
+    Listing IDs requested within the same event-loop tick are collected into
+    one pending batch and resolved together with a single
+    getListingsByListingIds call, so N concurrent lookups cost one round trip.
+    """
+
+    def __init__(self, client: "EtsyClient"):
+        self._client = client
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._flush_scheduled = False
+
+    def load(self, listing_id: str) -> asyncio.Future:
+        """Queue a listing ID and return a future for its record."""
+        listing_id = str(listing_id)
+        future = self._pending.get(listing_id)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending[listing_id] = future
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            asyncio.get_running_loop().call_soon(self._start_flush)
+        return future
+
+    def _start_flush(self) -> None:
+        self._flush_scheduled = False
+        pending, self._pending = self._pending, {}
+        if pending:
+            asyncio.ensure_future(self._flush(pending))
+
+    async def _flush(self, pending: Dict[str, asyncio.Future]) -> None:
+        try:
+            data = await self._client.get_listings_by_ids(list(pending))
+            by_id = {
+                str(listing.get("listing_id")): listing
+                for listing in data.get("results", [])
+            }
+            for listing_id, future in pending.items():
+                if future.done():
+                    continue
+                listing = by_id.get(listing_id)
+                if listing is not None:
+                    future.set_result(listing)
+                else:
+                    future.set_exception(
+                        KeyError(f"listing {listing_id} not in batch response")
+                    )
+        except Exception as exc:
+            for future in pending.values():
+                if not future.done():
+                    future.set_exception(exc)
+
 
 class EtsyClient:
     """Client for interacting with Etsy's API v3."""
-    
+
     BASE_URL = "https://openapi.etsy.com/v3"
-    
+
+    # Endpoint URL templates, relative to the client-level base_url so httpx
+    # joins against its cached parsed base instead of re-parsing an absolute
+    # URL per call; per-call construction is a single %-substitution.
+    _URL_USERS_ME = "/application/users/me"
+    _URL_USER_SHOPS = "/application/users/%s/shops"
+    _URL_SHOP = "/application/shops/%s"
+    _URL_SHOP_LISTINGS = "/application/shops/%s/listings"
+    _URL_SHOP_ACTIVE = "/application/shops/%s/listings/active"
+    _URL_LISTING = "/application/shops/%s/listings/%s"
+    _URL_LISTING_LEGACY = _URL_LISTING + "?legacy=true"
+    _URL_RSD = "/application/shops/%s/readiness-state-definitions"
+    _URL_RSD_ONE = "/application/shops/%s/readiness-state-definitions/%s"
+    _URL_LISTING_DELETE = "/application/listings/%s"
+    _URL_SHIPPING_PROFILES = "/application/shops/%s/shipping-profiles"
+    _URL_SHIPPING_PROFILE = "/application/shops/%s/shipping-profiles/%s"
+    _URL_SP_DESTINATIONS = _URL_SHIPPING_PROFILE + "/destinations"
+    _URL_SP_DESTINATION = _URL_SP_DESTINATIONS + "/%s"
+    _URL_SP_UPGRADES = _URL_SHIPPING_PROFILE + "/upgrades"
+    _URL_SP_UPGRADE = _URL_SP_UPGRADES + "/%s"
+    _URL_RETURN_POLICIES = "/application/shops/%s/policies/return"
+    _URL_RETURN_POLICY = _URL_RETURN_POLICIES + "/%s"
+    _URL_RETURN_CONSOLIDATE = _URL_RETURN_POLICIES + "/consolidate"
+    _URL_HOLIDAY_PREFS = "/application/shops/%s/holiday-preferences"
+    _URL_HOLIDAY_PREF = _URL_HOLIDAY_PREFS + "/%s"
+
+    # Fully pre-encoded query for the default get_shop_listings call, so the
+    # common case skips params-dict construction and httpx's query encoding.
+    _ACTIVE_25_QUERY = "?state=active&limit=25&allow_suggested_title=true&offset="
+
+    # Per-phase timeouts: Etsy's p99 sits well under 2s, so a stuck connect
+    # should fail fast instead of holding a pool slot for 30s. Writes get a
+    # longer read timeout since Etsy can be slow committing them.
+    __slots__ = (
+        "api_key",
+        "access_token",
+        "async_client",
+        "_ttl_cache",
+        "_etag_cache",
+        "_inflight",
+        "_request_cache",
+        "_listing_loader",
+        "_bearer",
+        "_headers_auth",
+        "_headers_json",
+        "_headers_form",
+    )
+
+    # Bound for the validator/request caches; full-shop crawls push one
+    # entry per pagination offset through them, so they must evict.
+    _GET_CACHE_MAXSIZE = 128
+
+    _TIMEOUT = httpx.Timeout(connect=3.0, read=10.0, write=10.0, pool=5.0)
+    _TIMEOUT_WRITE = httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=5.0)
+
+    # Process-wide AsyncClient shared by all EtsyClient instances so that
+    # TCP + TLS setup is paid once and connections are kept alive across calls.
+    _shared_async_client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def _get_shared_client(cls) -> httpx.AsyncClient:
+        """Return the shared AsyncClient, creating it on first use."""
+        if cls._shared_async_client is None or cls._shared_async_client.is_closed:
+            cls._shared_async_client = httpx.AsyncClient(
+                base_url=cls.BASE_URL,
+                timeout=cls._TIMEOUT,
+                # Static headers live on the client so httpx attaches them
+                # without per-request merging; with HTTP/2 they HPACK-index
+                # down to a byte or two after the first request. Credentials
+                # stay per-request because the pool is shared across clients.
+                headers={
+                    "User-Agent": "etsy-seller-mcp",
+                    "Accept-Encoding": "br, gzip",
+                },
+                transport=_RateLimitedTransport(
+                    httpx.AsyncHTTPTransport(
+                        http2=_HTTP2_AVAILABLE,
+                        # Connect-level retries only; never replays a sent request
+                        retries=2,
+                        limits=httpx.Limits(
+                            max_keepalive_connections=20,
+                            max_connections=100,
+                            keepalive_expiry=60.0,
+                        ),
+                    ),
+                    _TokenBucket(rate=_requests_per_second(), capacity=10.0),
+                ),
+            )
+        return cls._shared_async_client
+
+    @classmethod
+    async def aclose_shared_client(cls) -> None:
+        """Close the shared AsyncClient (call once at application shutdown)."""
+        if cls._shared_async_client is not None:
+            await cls._shared_async_client.aclose()
+            cls._shared_async_client = None
+
     def __init__(
         self, 
         api_key: Optional[str] = None, 
@@ -37,17 +526,333 @@ class EtsyClient:
         if not self.access_token:
             raise ValueError("No access token provided. Please use connect_etsy to authenticate.")
         
-        self.client = httpx.Client(timeout=30.0)
-        self.async_client = httpx.AsyncClient(timeout=30.0)
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Get the authentication headers for API requests."""
-        return {
+        self.async_client = self._get_shared_client()
+
+        # Per-instance cache backing _async_ttl_cache-decorated methods.
+        self._ttl_cache: OrderedDict = OrderedDict()
+
+        # Last-seen ETag and parsed body per request URL, for conditional
+        # GETs. LRU-bounded like _ttl_cache so crawls cannot grow it forever.
+        self._etag_cache: OrderedDict = OrderedDict()
+
+        # In-flight request map backing _single_flight.
+        self._inflight: Dict[Any, asyncio.Task] = {}
+
+        # Prepared GET requests reused across conditional fetches of a URL.
+        self._request_cache: OrderedDict = OrderedDict()
+
+        # Batcher aggregating load_listing calls per event-loop tick.
+        self._listing_loader = _ListingLoader(self)
+
+        # Credentials never change for the lifetime of a client, so build the
+        # header dicts once instead of on every request.
+        self._bearer = f"Bearer {self.access_token}"
+        self._headers_auth = {
             "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
+            "Authorization": self._bearer,
+        }
+        self._headers_json = {
+            **self._headers_auth,
             "Content-Type": "application/json",
         }
+        self._headers_form = {
+            **self._headers_auth,
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
+    def _get_headers(self) -> Dict[str, str]:
+        """Get the authentication headers for API requests."""
+        return self._headers_json
+
+    def _invalidate_cached(self, *method_names: str) -> None:
+        """
+        Drop TTL-cache entries for the named read methods.
+
+        Called by write paths so subsequent reads see their own changes
+        instead of a stale cached page.
+
+        Args:
+            *method_names: Names of _async_ttl_cache-decorated methods.
+        """
+        cache = self._ttl_cache
+        for key in [k for k in cache if k[0] in method_names]:
+            del cache[key]
+
+    def invalidate_caches(self) -> None:
+        """
+        Drop every client-side cache entry.
+
+        Clears both the TTL memoization cache and the ETag/Last-Modified
+        validator cache, forcing the next call on each endpoint to hit the
+        network. Useful after out-of-band shop changes.
+        """
+        self._ttl_cache.clear()
+        self._etag_cache.clear()
+
+    async def _single_flight(self, key, coro_factory):
+        """
+        Coalesce duplicate concurrent requests onto one network call.
+
+        While a request for `key` is in flight, additional callers await the
+        same task instead of issuing their own round trip.
+
+        Args:
+            key: Hashable identity of the request.
+            coro_factory: Zero-argument callable returning the request coroutine.
+
+        Returns:
+            The shared request's result.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(coro_factory())
+            self._inflight[key] = task
+            try:
+                return await task
+            finally:
+                self._inflight.pop(key, None)
+        return await task
+
+    async def _conditional_get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Issue a GET with ETag / Last-Modified revalidation.
+
+        Cached per fully-encoded request URL, so paginated calls with
+        different offsets revalidate independently. On 304 Not Modified the
+        previously parsed body is returned with no download and no decode.
+
+        Args:
+            url: Absolute endpoint URL.
+            params: Optional query parameters.
+
+        Returns:
+            Parsed JSON response body.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        # Reuse the built Request on repeat hits; single-flight guarantees
+        # no two sends of the same key overlap, so mutation is safe.
+        key = (url, tuple(sorted(params.items())) if params else None)
+        entry = self._request_cache.get(key)
+        if entry is None:
+            request = self.async_client.build_request(
+                "GET", url, headers=self._headers_json, params=params
+            )
+            entry = (request, str(request.url))
+            self._request_cache[key] = entry
+            if len(self._request_cache) > self._GET_CACHE_MAXSIZE:
+                self._request_cache.popitem(last=False)
+        else:
+            self._request_cache.move_to_end(key)
+        request, cache_key = entry
+        # Duplicate concurrent fetches of the same URL share one round trip
+        return await self._single_flight(
+            cache_key, lambda: self._do_conditional_get(request, cache_key)
+        )
+
+    async def _do_conditional_get(
+        self,
+        request: httpx.Request,
+        cache_key: str
+    ) -> Dict[str, Any]:
+        """Send a prepared conditional GET and maintain the validator cache."""
+        entry = self._etag_cache.get(cache_key)
+        if entry is not None:
+            self._etag_cache.move_to_end(cache_key)
+            etag, last_modified, cached = entry
+        else:
+            etag = last_modified = cached = None
+        # Send both validators when available; the server honours whichever
+        # it supports for the resource.
+        if etag is not None:
+            request.headers["If-None-Match"] = etag
+        elif "If-None-Match" in request.headers:
+            del request.headers["If-None-Match"]
+        if last_modified is not None:
+            request.headers["If-Modified-Since"] = last_modified
+        elif "If-Modified-Since" in request.headers:
+            del request.headers["If-Modified-Since"]
+        response = await self.async_client.send(request, stream=True)
+        try:
+            if response.status_code == 304:
+                return cached
+            response.raise_for_status()
+            body = await self._read_body(response)
+        finally:
+            await response.aclose()
+        data = orjson.loads(body)
+        new_etag = response.headers.get("ETag")
+        new_last_modified = response.headers.get("Last-Modified")
+        if new_etag or new_last_modified:
+            self._etag_cache[cache_key] = (new_etag, new_last_modified, data)
+            self._etag_cache.move_to_end(cache_key)
+            if len(self._etag_cache) > self._GET_CACHE_MAXSIZE:
+                self._etag_cache.popitem(last=False)
+        return data
+
+    @staticmethod
+    async def _read_body(response: httpx.Response) -> bytes:
+        """Stream a response body into a single buffer."""
+        buf = bytearray()
+        async for chunk in response.aiter_bytes():
+            buf += chunk
+        return bytes(buf)
+
+    async def _get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        GET an endpoint and parse its JSON body.
+
+        Shared tail for the plain read endpoints; conditional-GET and
+        streamed variants exist for the cacheable and large-payload ones.
+
+        Args:
+            url: Relative endpoint URL.
+            params: Optional query parameters.
+
+        Returns:
+            Parsed JSON response body.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        response = await self.async_client.get(
+            url, headers=self._headers_json, params=params
+        )
+        return _parse(response)
+
+    async def _get_json_streamed(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        GET a large JSON payload without double-buffering it.
+
+        Streams the body chunk by chunk into one growing buffer and hands it
+        straight to orjson, instead of httpx materializing its own full copy
+        of the content first.
+
+        Args:
+            url: Absolute endpoint URL.
+            params: Optional query parameters.
+
+        Returns:
+            Parsed JSON response body.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        async with self.async_client.stream(
+            "GET", url, headers=self._headers_json, params=params
+        ) as response:
+            response.raise_for_status()
+            body = await self._read_body(response)
+        return orjson.loads(body)
+
+    async def _write(
+        self,
+        method: str,
+        url: str,
+        data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Send a form-encoded write and parse the response.
+
+        One path for every mutating endpoint: the precomputed form headers,
+        a pre-encoded body, and the longer write timeout, so cross-cutting
+        concerns land here once instead of in each method.
+
+        Args:
+            method: HTTP method (POST, PUT, PATCH).
+            url: Relative endpoint URL.
+            data: Form fields to encode. Lists become repeated fields.
+
+        Returns:
+            Parsed JSON response body.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        return await self._write_encoded(method, url, _encode_form(data))
+
+    async def _write_encoded(
+        self,
+        method: str,
+        url: str,
+        body: bytes
+    ) -> Dict[str, Any]:
+        """Send an already-encoded form body; fast path for constant payloads."""
+        response = await self.async_client.request(
+            method,
+            url,
+            headers=self._headers_form,
+            content=body,
+            timeout=self._TIMEOUT_WRITE,
+        )
+        return _parse(response)
+
+    async def _delete(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Issue a DELETE and read the body only when one exists.
+
+        Etsy deletes normally answer 204 No Content; streaming the
+        response lets that common path skip the body read and buffer
+        allocation entirely.
+
+        Args:
+            url: Relative endpoint URL.
+
+        Returns:
+            Parsed JSON response body, or None for an empty body.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        async with self.async_client.stream(
+            "DELETE", url, headers=self._headers_json, timeout=self._TIMEOUT_WRITE
+        ) as response:
+            response.raise_for_status()
+            if response.headers.get("Content-Length") == "0":
+                return None
+            body = await self._read_body(response)
+        return orjson.loads(body) if body else None
+
+    async def _delete_or_stub(
+        self,
+        url: str,
+        id_key: str,
+        id_value: str
+    ) -> Dict[str, Any]:
+        """
+        Issue a streamed DELETE, substituting a stub for empty responses.
+
+        Args:
+            url: Relative endpoint URL.
+            id_key: Name of the identifier to echo in the stub.
+            id_value: Identifier of the deleted resource.
+
+        Returns:
+            Parsed JSON response body, or {"deleted": True, id_key: id_value}
+            when the server answered with no content.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        result = await self._delete(url)
+        if result is not None:
+            return result
+        return {"deleted": True, id_key: id_value}
     
+    @_async_ttl_cache(ttl=3600.0)
     async def get_current_user(self) -> Dict[str, Any]:
         """
         Get information about the currently authenticated user.
@@ -58,11 +863,9 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/users/me"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._conditional_get(self._URL_USERS_ME)
     
+    @_async_ttl_cache(ttl=3600.0)
     async def get_user_shops(self, user_id: str) -> Dict[str, Any]:
         """
         Get shops owned by a user.
@@ -76,11 +879,10 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/users/{user_id}/shops"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_USER_SHOPS % user_id
+        return await self._get_json(url)
     
+    @_async_ttl_cache(ttl=60.0)
     async def get_shop(self, shop_id: str) -> Dict[str, Any]:
         """
         Get shop information by shop ID.
@@ -94,19 +896,45 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_SHOP % shop_id
+        return await self._conditional_get(url)
     
+    async def get_shop_bundle(self, shop_id: str) -> Dict[str, Any]:
+        """
+        Fetch the common per-shop bootstrap data in parallel.
+
+        Issues get_shop, get_shop_listings, and get_processing_profiles
+        concurrently so the caller pays one round trip instead of three.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+
+        Returns:
+            Dictionary with 'shop', 'listings', and 'processing_profiles' keys.
+
+        Raises:
+            httpx.HTTPError: If any of the API requests fail.
+        """
+        shop, listings, profiles = await asyncio.gather(
+            self.get_shop(shop_id),
+            self.get_shop_listings(shop_id),
+            self.get_processing_profiles(shop_id),
+        )
+        return {
+            "shop": shop,
+            "listings": listings,
+            "processing_profiles": profiles,
+        }
+
     async def get_shop_listings(
         self, 
         shop_id: str, 
         state: Optional[str] = "active",
         limit: int = 25,
         offset: int = 0,
-        allow_suggested_title: bool = True
-    ) -> Dict[str, Any]:
+        allow_suggested_title: bool = True,
+        as_struct: bool = False
+    ) -> Any:
         """
         Get listings for a shop.
         
@@ -117,26 +945,136 @@ class EtsyClient:
             limit: Number of results to return (max 100). Default is 25.
             offset: Offset for pagination. Default is 0.
             allow_suggested_title: Include suggested titles if available. Default is True.
+            as_struct: Decode into a typed ShopListingsPage instead of a dict.
+                       Requires the optional msgspec package. Default is False.
         
         Returns:
-            Dictionary containing listings array and pagination info.
+            Dictionary containing listings array and pagination info, or a
+            ShopListingsPage struct when as_struct is True.
         
         Raises:
             httpx.HTTPError: If the API request fails.
+            RuntimeError: If as_struct is True but msgspec is not installed.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings"
-        params = {
-            "limit": limit,
-            "offset": offset,
-            "allow_suggested_title": allow_suggested_title
-        }
-        if state:
-            params["state"] = state
-        
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
-    
+        url = self._URL_SHOP_LISTINGS % shop_id
+
+        fast_path = state == "active" and limit == 25 and allow_suggested_title
+        if fast_path:
+            url = url + self._ACTIVE_25_QUERY + str(offset)
+            params = None
+        else:
+            params = {
+                "limit": limit,
+                "offset": offset,
+                "allow_suggested_title": allow_suggested_title
+            }
+            if state:
+                params["state"] = state
+
+        if as_struct:
+            # Typed decode skips the intermediate dict tree entirely
+            if _LISTINGS_DECODER is None:
+                raise RuntimeError(
+                    "as_struct=True requires the optional msgspec package"
+                )
+            response = await self.async_client.get(
+                url, headers=self._headers_json, params=params
+            )
+            response.raise_for_status()
+            return _LISTINGS_DECODER.decode(response.content)
+
+        return await self._conditional_get(url, params)
+
+    async def iter_all_shop_listings(
+        self,
+        shop_id: str,
+        state: Optional[str] = "active",
+        page_size: int = 100,
+        concurrency: int = 4
+    ):
+        """
+        Iterate every listing in a shop, fetching pages concurrently.
+
+        Keeps `concurrency` pages in flight per batch so all but the slowest
+        round trip of each batch is hidden.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            state: Filter by listing state. Default is 'active'.
+            page_size: Listings per page (max 100). Default is 100.
+            concurrency: Pages fetched in parallel per batch. Default is 4.
+
+        Yields:
+            Individual listing dictionaries.
+
+        Raises:
+            httpx.HTTPError: If any page request fails.
+        """
+        offset = 0
+        while True:
+            offsets = [offset + i * page_size for i in range(concurrency)]
+            pages = await asyncio.gather(*[
+                self.get_shop_listings(shop_id, state, page_size, o)
+                for o in offsets
+            ])
+            exhausted = False
+            for page in pages:
+                results = page.get("results") or []
+                for listing in results:
+                    yield listing
+                if len(results) < page_size:
+                    exhausted = True
+            if exhausted:
+                return
+            offset += page_size * concurrency
+
+    async def get_all_shop_listings(
+        self,
+        shop_id: str,
+        state: Optional[str] = "active",
+        page_size: int = 100,
+        concurrency: int = 8
+    ) -> list:
+        """
+        Fetch every listing in a shop, paginating concurrently.
+
+        The first page reveals the total count; the remaining pages are
+        then fetched in parallel under a semaphore, so an N-page crawl
+        costs roughly N/concurrency round trips instead of N.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            state: Filter by listing state. Default is 'active'.
+            page_size: Listings per page (max 100). Default is 100.
+            concurrency: Maximum pages in flight at once. Default is 8.
+
+        Returns:
+            List of all listing dictionaries.
+
+        Raises:
+            httpx.HTTPError: If any page request fails.
+        """
+        first = await self.get_shop_listings(shop_id, state, page_size)
+        total = first.get("count", 0)
+        results = list(first.get("results") or [])
+        if total <= page_size:
+            return results
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(offset: int) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_shop_listings(
+                    shop_id, state, page_size, offset
+                )
+
+        pages = await asyncio.gather(*[
+            fetch(offset) for offset in range(page_size, total, page_size)
+        ])
+        for page in pages:
+            results.extend(page.get("results") or [])
+        return results
+
     async def search_shop_listings(
         self, 
         shop_id: str, 
@@ -162,7 +1100,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/active"
+        url = self._URL_SHOP_ACTIVE % shop_id
         params = {
             "limit": limit,
             "offset": offset,
@@ -171,9 +1109,7 @@ class EtsyClient:
         if keywords:
             params["keywords"] = keywords
         
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json_streamed(url, params)
     
     async def get_listing(
         self,
@@ -193,14 +1129,48 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}"
+        url = f"/application/listings/{listing_id}"
         params = {
             "allow_suggested_title": allow_suggested_title
         }
         
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
+
+    async def get_listings_by_ids(self, listing_ids: list) -> Dict[str, Any]:
+        """
+        Get multiple listings in a single call by their IDs.
+
+        Args:
+            listing_ids: List of numeric listing IDs (max 100 per call).
+
+        Returns:
+            Dictionary containing the listings array.
+
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        url = "/application/listings/batch"
+        params = {"listing_ids": _csv_ids(listing_ids)}
+        return await self._get_json(url, params)
+
+    async def load_listing(self, listing_id: str) -> Dict[str, Any]:
+        """
+        Get a single listing through the tick-scoped batch loader.
+
+        Concurrent load_listing calls issued within one event-loop tick are
+        aggregated into a single getListingsByListingIds request.
+
+        Args:
+            listing_id: The numeric ID of the listing.
+
+        Returns:
+            Dictionary containing the listing information.
+
+        Raises:
+            httpx.HTTPError: If the batched API request fails.
+            KeyError: If the listing is missing from the batch response.
+        """
+        return await self._listing_loader.load(listing_id)
 
     async def get_listing_inventory(
         self,
@@ -224,7 +1194,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}/inventory"
+        url = f"/application/listings/{listing_id}/inventory"
         params: Dict[str, Any] = {}
         if show_deleted:
             params["show_deleted"] = True
@@ -233,10 +1203,42 @@ class EtsyClient:
         if legacy is not None:
             params["legacy"] = bool(legacy)
 
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
+    async def get_listing_inventories(
+        self,
+        listing_ids: list,
+        concurrency: int = 8,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Fetch inventory records for many listings concurrently.
+
+        Etsy has no server-side batch for inventories, so this overlaps the
+        per-listing round trips under a semaphore instead of awaiting them
+        one by one.
+
+        Args:
+            listing_ids: Listing IDs to fetch inventory for.
+            concurrency: Maximum requests in flight at once. Default is 8.
+            **kwargs: Optional keyword arguments forwarded to
+                      get_listing_inventory (show_deleted, includes, legacy).
+
+        Returns:
+            Mapping of listing_id to its inventory dict; failed entries map
+            to the raised exception instead of a result dict.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(listing_id: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_listing_inventory(listing_id, **kwargs)
+
+        results = await asyncio.gather(
+            *[fetch(lid) for lid in listing_ids], return_exceptions=True
+        )
+        return dict(zip(listing_ids, results))
+
     async def update_listing(
         self, 
         shop_id: str,
@@ -258,35 +1260,28 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}"
-        if legacy:
-            # Enable processing profiles fields per Etsy API docs
-            url = f"{url}?legacy=true"
-        
-        # Filter out None values
-        data = {k: v for k, v in kwargs.items() if v is not None}
+        # legacy=true enables processing profiles fields per Etsy API docs
+        url = (
+            self._URL_LISTING_LEGACY if legacy else self._URL_LISTING
+        ) % (shop_id, listing_id)
+
+        # Filter out None values; skip the rebuild when nothing needs dropping
+        data = kwargs
+        if any(v is None for v in data.values()):
+            data = {k: v for k, v in data.items() if v is not None}
         
         # updateListing expects application/x-www-form-urlencoded format per Etsy API docs
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
         # Manually encode arrays for form-urlencoded format
         # For Etsy API, arrays like tags and materials should be sent as comma-separated strings
         encoded_data = {}
         for key, value in data.items():
             if isinstance(value, list):
                 # Join array items with commas for form-urlencoded format
-                encoded_data[key] = ','.join(str(item) for item in value)
+                encoded_data[key] = _csv_ids(value)
             else:
                 encoded_data[key] = value
         
-        # Send as form-urlencoded data
-        response = await self.async_client.patch(url, headers=headers, data=encoded_data)
-        response.raise_for_status()
-        return response.json()
+        return await self._write("PATCH", url, encoded_data)
 
     async def update_listing_property(
         self,
@@ -314,7 +1309,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/properties/{property_id}"
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/properties/{property_id}"
         
         # Build form data
         data = {
@@ -326,16 +1321,9 @@ class EtsyClient:
             data["scale_id"] = scale_id
         
         # updateListingProperty expects application/x-www-form-urlencoded format
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        return await self._write("PUT", url, data)
 
+    @_async_ttl_cache(ttl=60.0)
     async def get_processing_profiles(
         self,
         shop_id: str,
@@ -345,15 +1333,14 @@ class EtsyClient:
         """
         Retrieve Processing Profiles (Readiness State Definitions) for a shop.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/readiness-state-definitions"
+        url = self._URL_RSD % shop_id
         params = {
             "limit": limit,
             "offset": offset,
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json_streamed(url, params)
 
+    @_async_ttl_cache(ttl=60.0)
     async def get_processing_profile(
         self,
         shop_id: str,
@@ -362,13 +1349,8 @@ class EtsyClient:
         """
         Retrieve a single Processing Profile by ID.
         """
-        url = (
-            f"{self.BASE_URL}/application/shops/{shop_id}/readiness-state-definitions/"
-            f"{readiness_state_definition_id}"
-        )
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_RSD_ONE % (shop_id, readiness_state_definition_id)
+        return await self._get_json(url)
 
     async def create_processing_profile(
         self,
@@ -381,21 +1363,16 @@ class EtsyClient:
         """
         Create a Processing Profile (Readiness State Definition).
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/readiness-state-definitions"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        url = self._URL_RSD % shop_id
         data = {
             "readiness_state": readiness_state,
             "min_processing_time": min_processing_time,
             "max_processing_time": max_processing_time,
             "processing_time_unit": processing_time_unit,
         }
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        result = await self._write("POST", url, data)
+        self._invalidate_cached("get_processing_profiles", "get_processing_profile")
+        return result
 
     async def update_processing_profile(
         self,
@@ -410,27 +1387,20 @@ class EtsyClient:
         Update a Processing Profile (Readiness State Definition).
         Only provided fields will be updated.
         """
-        url = (
-            f"{self.BASE_URL}/application/shops/{shop_id}/readiness-state-definitions/"
-            f"{readiness_state_definition_id}"
-        )
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
+        url = self._URL_RSD_ONE % (shop_id, readiness_state_definition_id)
+        data: Dict[str, Any] = {
+            k: v
+            for k, v in (
+                ("readiness_state", readiness_state),
+                ("min_processing_time", min_processing_time),
+                ("max_processing_time", max_processing_time),
+                ("processing_time_unit", processing_time_unit),
+            )
+            if v is not None
         }
-        data: Dict[str, Any] = {}
-        if readiness_state is not None:
-            data["readiness_state"] = readiness_state
-        if min_processing_time is not None:
-            data["min_processing_time"] = min_processing_time
-        if max_processing_time is not None:
-            data["max_processing_time"] = max_processing_time
-        if processing_time_unit is not None:
-            data["processing_time_unit"] = processing_time_unit
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        result = await self._write("PUT", url, data)
+        self._invalidate_cached("get_processing_profiles", "get_processing_profile")
+        return result
 
     async def delete_processing_profile(
         self,
@@ -440,16 +1410,12 @@ class EtsyClient:
         """
         Delete a Processing Profile (Readiness State Definition) by ID.
         """
-        url = (
-            f"{self.BASE_URL}/application/shops/{shop_id}/readiness-state-definitions/"
-            f"{readiness_state_definition_id}"
-        )
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "readiness_state_definition_id": readiness_state_definition_id}
+        url = self._URL_RSD_ONE % (shop_id, readiness_state_definition_id)
+        result = await self._delete_or_stub(url, "readiness_state_definition_id", readiness_state_definition_id)
+        self._invalidate_cached("get_processing_profiles", "get_processing_profile")
+        return result
 
+    @_async_ttl_cache(ttl=60.0)
     async def get_shipping_profiles(
         self,
         shop_id: str,
@@ -459,15 +1425,14 @@ class EtsyClient:
         """
         Retrieve shipping profiles for a shop.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles"
+        url = self._URL_SHIPPING_PROFILES % shop_id
         params = {
             "limit": limit,
             "offset": offset,
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
 
+    @_async_ttl_cache(ttl=60.0)
     async def get_shipping_profile(
         self,
         shop_id: str,
@@ -477,11 +1442,9 @@ class EtsyClient:
         Retrieve a single shipping profile by ID.
         """
         url = (
-            f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}"
+            f"/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}"
         )
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url)
     
     async def delete_listing(self, listing_id: str) -> Dict[str, Any]:
         """
@@ -496,14 +1459,10 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        # DELETE typically returns the deleted resource or empty response
-        if response.text:
-            return response.json()
-        return {"deleted": True, "listing_id": listing_id}
+        url = self._URL_LISTING_DELETE % listing_id
+        return await self._delete_or_stub(url, "listing_id", listing_id)
     
+    @_async_ttl_cache(ttl=60.0)
     async def get_shop_sections(self, shop_id: str) -> Dict[str, Any]:
         """
         Retrieve the list of shop sections in a specific shop.
@@ -517,11 +1476,10 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/sections"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/sections"
+        return await self._get_json(url)
     
+    @_async_ttl_cache(ttl=60.0)
     async def get_shop_section(self, shop_id: str, shop_section_id: str) -> Dict[str, Any]:
         """
         Retrieve a single shop section by ID.
@@ -536,10 +1494,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/sections/{shop_section_id}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/sections/{shop_section_id}"
+        return await self._get_json(url)
     
     async def create_shop_section(self, shop_id: str, title: str) -> Dict[str, Any]:
         """
@@ -555,16 +1511,11 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/sections"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        url = f"/application/shops/{shop_id}/sections"
         data = {"title": title}
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        result = await self._write("POST", url, data)
+        self._invalidate_cached("get_shop_sections", "get_shop_section")
+        return result
     
     async def update_shop_section(
         self, 
@@ -586,16 +1537,11 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/sections/{shop_section_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        url = f"/application/shops/{shop_id}/sections/{shop_section_id}"
         data = {"title": title}
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        result = await self._write("PUT", url, data)
+        self._invalidate_cached("get_shop_sections", "get_shop_section")
+        return result
     
     async def delete_shop_section(
         self, 
@@ -615,13 +1561,10 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/sections/{shop_section_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        # DELETE typically returns empty response (204)
-        if response.text:
-            return response.json()
-        return {"deleted": True, "shop_section_id": shop_section_id}
+        url = f"/application/shops/{shop_id}/sections/{shop_section_id}"
+        result = await self._delete_or_stub(url, "shop_section_id", shop_section_id)
+        self._invalidate_cached("get_shop_sections", "get_shop_section")
+        return result
     
     async def get_reviews_by_listing(
         self,
@@ -647,57 +1590,134 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}/reviews"
+        url = f"/application/listings/{listing_id}/reviews"
         params: Dict[str, Any] = {
             "limit": limit,
             "offset": offset
         }
-        if min_created is not None:
-            params["min_created"] = min_created
-        if max_created is not None:
-            params["max_created"] = max_created
+        params.update(_p(min_created=min_created, max_created=max_created))
         
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json_streamed(url, params)
     
     async def get_reviews_by_shop(
         self,
         shop_id: str,
-        limit: int = 25,
-        offset: int = 0,
+        limit: int = 25,
+        offset: int = 0,
+        min_created: Optional[int] = None,
+        max_created: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Retrieve reviews for a specific shop.
+        
+        Args:
+            shop_id: The unique identifier for the shop.
+            limit: Number of results to return (max 100). Default is 25.
+            offset: Offset for pagination. Default is 0.
+            min_created: The earliest unix timestamp for when a review was created.
+            max_created: The latest unix timestamp for when a review was created.
+        
+        Returns:
+            Dictionary containing reviews array and pagination info.
+        
+        Raises:
+            httpx.HTTPError: If the API request fails.
+        """
+        url = f"/application/shops/{shop_id}/reviews"
+        params: Dict[str, Any] = {
+            "limit": limit,
+            "offset": offset
+        }
+        params.update(_p(min_created=min_created, max_created=max_created))
+        
+        return await self._get_json_streamed(url, params)
+
+    async def iter_reviews_by_shop(
+        self,
+        shop_id: str,
+        page_size: int = 100,
+        min_created: Optional[int] = None,
+        max_created: Optional[int] = None
+    ):
+        """
+        Iterate every review for a shop, one review at a time.
+
+        Pages are fetched lazily as the consumer advances, so peak memory
+        stays bounded by one page regardless of how many reviews exist.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            page_size: Reviews per page (max 100). Default is 100.
+            min_created: The earliest unix timestamp for when a review was created.
+            max_created: The latest unix timestamp for when a review was created.
+
+        Yields:
+            Individual review dictionaries.
+
+        Raises:
+            httpx.HTTPError: If any page request fails.
+        """
+        offset = 0
+        while True:
+            page = await self.get_reviews_by_shop(
+                shop_id, page_size, offset, min_created, max_created
+            )
+            results = page.get("results") or []
+            for review in results:
+                yield review
+            if len(results) < page_size:
+                return
+            offset += page_size
+
+    async def get_all_reviews_by_shop(
+        self,
+        shop_id: str,
+        page_size: int = 100,
+        concurrency: int = 8,
         min_created: Optional[int] = None,
         max_created: Optional[int] = None
-    ) -> Dict[str, Any]:
+    ) -> list:
         """
-        Retrieve reviews for a specific shop.
-        
+        Fetch every review for a shop, paginating concurrently.
+
+        Uses the count from the first page to issue the remaining page
+        requests in parallel under a semaphore.
+
         Args:
             shop_id: The unique identifier for the shop.
-            limit: Number of results to return (max 100). Default is 25.
-            offset: Offset for pagination. Default is 0.
+            page_size: Reviews per page (max 100). Default is 100.
+            concurrency: Maximum pages in flight at once. Default is 8.
             min_created: The earliest unix timestamp for when a review was created.
             max_created: The latest unix timestamp for when a review was created.
-        
+
         Returns:
-            Dictionary containing reviews array and pagination info.
-        
+            List of all review dictionaries.
+
         Raises:
-            httpx.HTTPError: If the API request fails.
+            httpx.HTTPError: If any page request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/reviews"
-        params: Dict[str, Any] = {
-            "limit": limit,
-            "offset": offset
-        }
-        if min_created is not None:
-            params["min_created"] = min_created
-        if max_created is not None:
-            params["max_created"] = max_created
-        
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        first = await self.get_reviews_by_shop(
+            shop_id, page_size, 0, min_created, max_created
+        )
+        total = first.get("count", 0)
+        results = list(first.get("results") or [])
+        if total <= page_size:
+            return results
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(offset: int) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_reviews_by_shop(
+                    shop_id, page_size, offset, min_created, max_created
+                )
+
+        pages = await asyncio.gather(*[
+            fetch(offset) for offset in range(page_size, total, page_size)
+        ])
+        for page in pages:
+            results.extend(page.get("results") or [])
+        return results
     
     # Payment & Financial Data Methods
     
@@ -725,16 +1745,51 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/payment-account/ledger-entries"
+        url = f"/application/shops/{shop_id}/payment-account/ledger-entries"
         params = {
             "min_created": min_created,
             "max_created": max_created,
             "limit": limit,
             "offset": offset
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json_streamed(url, params)
+
+    async def iter_payment_ledger_entries(
+        self,
+        shop_id: str,
+        min_created: int,
+        max_created: int,
+        page_size: int = 100
+    ):
+        """
+        Iterate every ledger entry in a time window, one entry at a time.
+
+        Pages are fetched lazily as the consumer advances, so peak memory
+        stays bounded by one page even for long accounting windows.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            min_created: The earliest unix timestamp for when a record was created.
+            max_created: The latest unix timestamp for when a record was created.
+            page_size: Entries per page (max 100). Default is 100.
+
+        Yields:
+            Individual ledger entry dictionaries.
+
+        Raises:
+            httpx.HTTPError: If any page request fails.
+        """
+        offset = 0
+        while True:
+            page = await self.get_payment_ledger_entries(
+                shop_id, min_created, max_created, page_size, offset
+            )
+            results = page.get("results") or []
+            for entry in results:
+                yield entry
+            if len(results) < page_size:
+                return
+            offset += page_size
     
     async def get_payment_by_receipt(
         self,
@@ -754,10 +1809,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/receipts/{receipt_id}/payments"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/receipts/{receipt_id}/payments"
+        return await self._get_json(url)
     
     async def get_payments(
         self,
@@ -777,14 +1830,12 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/payments"
+        url = f"/application/shops/{shop_id}/payments"
         params = {}
         if payment_ids:
-            params["payment_ids"] = ",".join(str(id) for id in payment_ids)
+            params["payment_ids"] = _csv_ids(payment_ids)
         
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
     async def get_ledger_entry_payments(
         self,
@@ -804,16 +1855,15 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/payment-account/ledger-entries/payments"
+        url = f"/application/shops/{shop_id}/payment-account/ledger-entries/payments"
         params = {
-            "ledger_entry_ids": ",".join(str(id) for id in ledger_entry_ids)
+            "ledger_entry_ids": _csv_ids(ledger_entry_ids)
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
     # Shipping Profile Management Methods
     
+    @_async_ttl_cache(ttl=3600.0)
     async def get_shipping_carriers(
         self,
         origin_country_iso: str
@@ -830,11 +1880,9 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shipping-carriers"
+        url = "/application/shipping-carriers"
         params = {"origin_country_iso": origin_country_iso}
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
     async def create_shipping_profile(
         self,
@@ -880,13 +1928,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = self._URL_SHIPPING_PROFILES % shop_id
         data: Dict[str, Any] = {
             "title": title,
             "origin_country_iso": origin_country_iso,
@@ -895,29 +1937,71 @@ class EtsyClient:
             "processing_time_unit": processing_time_unit
         }
         
-        if min_processing_time is not None:
-            data["min_processing_time"] = min_processing_time
-        if max_processing_time is not None:
-            data["max_processing_time"] = max_processing_time
-        if destination_country_iso is not None:
-            data["destination_country_iso"] = destination_country_iso
-        if destination_region is not None:
-            data["destination_region"] = destination_region
-        if origin_postal_code is not None:
-            data["origin_postal_code"] = origin_postal_code
-        if shipping_carrier_id is not None:
-            data["shipping_carrier_id"] = shipping_carrier_id
-        if mail_class is not None:
-            data["mail_class"] = mail_class
-        if min_delivery_days is not None:
-            data["min_delivery_days"] = min_delivery_days
-        if max_delivery_days is not None:
-            data["max_delivery_days"] = max_delivery_days
-        
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        data.update(_p(
+            min_processing_time=min_processing_time,
+            max_processing_time=max_processing_time,
+            destination_country_iso=destination_country_iso,
+            destination_region=destination_region,
+            origin_postal_code=origin_postal_code,
+            shipping_carrier_id=shipping_carrier_id,
+            mail_class=mail_class,
+            min_delivery_days=min_delivery_days,
+            max_delivery_days=max_delivery_days,
+        ))
+        
+        result = await self._write("POST", url, data)
+        self._invalidate_cached("get_shipping_profiles", "get_shipping_profile")
+        return result
     
+    async def create_shipping_profile_with_destinations(
+        self,
+        shop_id: str,
+        profile: Dict[str, Any],
+        destinations: Optional[list] = None,
+        upgrades: Optional[list] = None,
+        concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Create a shipping profile and populate it in one workflow.
+
+        Only the profile creation has to happen first; the destination and
+        upgrade POSTs all depend solely on the new profile id, so they are
+        fired concurrently instead of one awaited round trip at a time,
+        multiplexing over the shared connection.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            profile: Keyword-argument dict for create_shipping_profile.
+            destinations: Optional list of keyword-argument dicts for
+                          create_shipping_profile_destination.
+            upgrades: Optional list of keyword-argument dicts for
+                      create_shipping_profile_upgrade.
+            concurrency: Maximum requests in flight at once. Default is 8.
+
+        Returns:
+            Dictionary with the created 'profile' plus 'destinations' and
+            'upgrades' result lists; failed entries hold the raised
+            exception instead of a result dict.
+
+        Raises:
+            httpx.HTTPError: If the profile creation itself fails.
+        """
+        created = await self.create_shipping_profile(shop_id, **profile)
+        profile_id = created["shipping_profile_id"]
+        dest_results, upgrade_results = await asyncio.gather(
+            self.create_shipping_profile_destinations_bulk(
+                shop_id, profile_id, destinations or [], concurrency
+            ),
+            self.create_shipping_profile_upgrades_bulk(
+                shop_id, profile_id, upgrades or [], concurrency
+            ),
+        )
+        return {
+            "profile": created,
+            "destinations": dest_results,
+            "upgrades": upgrade_results,
+        }
+
     async def update_shipping_profile(
         self,
         shop_id: str,
@@ -948,30 +2032,23 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        url = self._URL_SHIPPING_PROFILE % (shop_id, shipping_profile_id)
+        data: Dict[str, Any] = _p(
+            title=title,
+            origin_country_iso=origin_country_iso,
+            min_processing_time=min_processing_time,
+            max_processing_time=max_processing_time,
+            processing_time_unit=processing_time_unit,
+            origin_postal_code=origin_postal_code,
+        )
         
-        data: Dict[str, Any] = {}
-        if title is not None:
-            data["title"] = title
-        if origin_country_iso is not None:
-            data["origin_country_iso"] = origin_country_iso
-        if min_processing_time is not None:
-            data["min_processing_time"] = min_processing_time
-        if max_processing_time is not None:
-            data["max_processing_time"] = max_processing_time
-        if processing_time_unit is not None:
-            data["processing_time_unit"] = processing_time_unit
-        if origin_postal_code is not None:
-            data["origin_postal_code"] = origin_postal_code
-        
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        # An empty payload would still cost a round trip and draw a 400.
+        if not data:
+            return {"noop": True}
+
+        result = await self._write("PUT", url, data)
+        self._invalidate_cached("get_shipping_profiles", "get_shipping_profile")
+        return result
     
     async def delete_shipping_profile(
         self,
@@ -991,12 +2068,10 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "shipping_profile_id": shipping_profile_id}
+        url = self._URL_SHIPPING_PROFILE % (shop_id, shipping_profile_id)
+        result = await self._delete_or_stub(url, "shipping_profile_id", shipping_profile_id)
+        self._invalidate_cached("get_shipping_profiles", "get_shipping_profile")
+        return result
     
     # Shipping Profile Destination Methods
     
@@ -1034,35 +2109,26 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = self._URL_SP_DESTINATIONS % (shop_id, shipping_profile_id)
         data: Dict[str, Any] = {
             "primary_cost": primary_cost,
             "secondary_cost": secondary_cost
         }
         
-        if destination_country_iso is not None:
-            data["destination_country_iso"] = destination_country_iso
-        if destination_region is not None:
-            data["destination_region"] = destination_region
-        if shipping_carrier_id is not None:
-            data["shipping_carrier_id"] = shipping_carrier_id
-        if mail_class is not None:
-            data["mail_class"] = mail_class
-        if min_delivery_days is not None:
-            data["min_delivery_days"] = min_delivery_days
-        if max_delivery_days is not None:
-            data["max_delivery_days"] = max_delivery_days
-        
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        data.update(_p(
+            destination_country_iso=destination_country_iso,
+            destination_region=destination_region,
+            shipping_carrier_id=shipping_carrier_id,
+            mail_class=mail_class,
+            min_delivery_days=min_delivery_days,
+            max_delivery_days=max_delivery_days,
+        ))
+        
+        result = await self._write("POST", url, data)
+        self._invalidate_cached("get_shipping_profile_destinations")
+        return result
     
+    @_async_ttl_cache(ttl=60.0)
     async def get_shipping_profile_destinations(
         self,
         shop_id: str,
@@ -1085,12 +2151,49 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations"
+        url = self._URL_SP_DESTINATIONS % (shop_id, shipping_profile_id)
         params = {"limit": limit, "offset": offset}
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
+    async def get_shipping_profile_destinations_many(
+        self,
+        shop_id: str,
+        profile_ids: list,
+        limit: int = 25,
+        offset: int = 0,
+        concurrency: int = 8
+    ) -> Dict[str, Any]:
+        """
+        Fetch destinations for many shipping profiles concurrently.
+
+        Tools that inspect every profile in a shop issued one awaited GET
+        per profile; this overlaps them under a semaphore, and repeat
+        profiles within the TTL window come straight from the cache.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            profile_ids: Shipping profile IDs to fetch destinations for.
+            limit: Number of results per profile (max 100). Default is 25.
+            offset: Offset for pagination. Default is 0.
+            concurrency: Maximum requests in flight at once. Default is 8.
+
+        Returns:
+            Mapping of profile_id to its destinations page; failed entries
+            map to the raised exception instead of a result dict.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(profile_id: str) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_shipping_profile_destinations(
+                    shop_id, profile_id, limit, offset
+                )
+
+        results = await asyncio.gather(
+            *[fetch(pid) for pid in profile_ids], return_exceptions=True
+        )
+        return dict(zip(profile_ids, results))
+
     async def update_shipping_profile_destination(
         self,
         shop_id: str,
@@ -1127,34 +2230,25 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations/{destination_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        url = self._URL_SP_DESTINATION % (shop_id, shipping_profile_id, destination_id)
+        data: Dict[str, Any] = _p(
+            primary_cost=primary_cost,
+            secondary_cost=secondary_cost,
+            destination_country_iso=destination_country_iso,
+            destination_region=destination_region,
+            shipping_carrier_id=shipping_carrier_id,
+            mail_class=mail_class,
+            min_delivery_days=min_delivery_days,
+            max_delivery_days=max_delivery_days,
+        )
         
-        data: Dict[str, Any] = {}
-        if primary_cost is not None:
-            data["primary_cost"] = primary_cost
-        if secondary_cost is not None:
-            data["secondary_cost"] = secondary_cost
-        if destination_country_iso is not None:
-            data["destination_country_iso"] = destination_country_iso
-        if destination_region is not None:
-            data["destination_region"] = destination_region
-        if shipping_carrier_id is not None:
-            data["shipping_carrier_id"] = shipping_carrier_id
-        if mail_class is not None:
-            data["mail_class"] = mail_class
-        if min_delivery_days is not None:
-            data["min_delivery_days"] = min_delivery_days
-        if max_delivery_days is not None:
-            data["max_delivery_days"] = max_delivery_days
-        
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        # An empty payload would still cost a round trip and draw a 400.
+        if not data:
+            return {"noop": True}
+
+        result = await self._write("PUT", url, data)
+        self._invalidate_cached("get_shipping_profile_destinations")
+        return result
     
     async def delete_shipping_profile_destination(
         self,
@@ -1176,15 +2270,50 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/destinations/{destination_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "destination_id": destination_id}
+        url = self._URL_SP_DESTINATION % (shop_id, shipping_profile_id, destination_id)
+        result = await self._delete_or_stub(url, "destination_id", destination_id)
+        self._invalidate_cached("get_shipping_profile_destinations")
+        return result
     
     # Shipping Profile Upgrade Methods
     
+    async def create_shipping_profile_destinations_bulk(
+        self,
+        shop_id: str,
+        shipping_profile_id: str,
+        destinations: list,
+        concurrency: int = 8
+    ) -> list:
+        """
+        Create several destinations on a profile concurrently.
+
+        Populating a profile one country at a time serializes a round trip
+        per destination; this overlaps them under a semaphore so the batch
+        costs roughly one round trip per `concurrency` entries.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            shipping_profile_id: The numeric ID of the shipping profile.
+            destinations: List of keyword-argument dicts, one per call to
+                          create_shipping_profile_destination.
+            concurrency: Maximum requests in flight at once. Default is 8.
+
+        Returns:
+            List of per-destination results in input order; failed entries
+            hold the raised exception instead of a result dict.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def create(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await self.create_shipping_profile_destination(
+                    shop_id, shipping_profile_id, **item
+                )
+
+        return await asyncio.gather(
+            *[create(item) for item in destinations], return_exceptions=True
+        )
+
     async def create_shipping_profile_upgrade(
         self,
         shop_id: str,
@@ -1219,13 +2348,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = self._URL_SP_UPGRADES % (shop_id, shipping_profile_id)
         data: Dict[str, Any] = {
             "type": upgrade_type,
             "upgrade_name": upgrade_name,
@@ -1233,19 +2356,18 @@ class EtsyClient:
             "secondary_price": secondary_price
         }
         
-        if shipping_carrier_id is not None:
-            data["shipping_carrier_id"] = shipping_carrier_id
-        if mail_class is not None:
-            data["mail_class"] = mail_class
-        if min_delivery_days is not None:
-            data["min_delivery_days"] = min_delivery_days
-        if max_delivery_days is not None:
-            data["max_delivery_days"] = max_delivery_days
+        data.update(_p(
+            shipping_carrier_id=shipping_carrier_id,
+            mail_class=mail_class,
+            min_delivery_days=min_delivery_days,
+            max_delivery_days=max_delivery_days,
+        ))
         
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        result = await self._write("POST", url, data)
+        self._invalidate_cached("get_shipping_profile_upgrades")
+        return result
     
+    @_async_ttl_cache(ttl=60.0)
     async def get_shipping_profile_upgrades(
         self,
         shop_id: str,
@@ -1264,10 +2386,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_SP_UPGRADES % (shop_id, shipping_profile_id)
+        return await self._get_json(url)
     
     async def update_shipping_profile_upgrade(
         self,
@@ -1305,34 +2425,25 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades/{upgrade_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        url = self._URL_SP_UPGRADE % (shop_id, shipping_profile_id, upgrade_id)
+        data: Dict[str, Any] = _p(
+            upgrade_name=upgrade_name,
+            type=upgrade_type,
+            price=price,
+            secondary_price=secondary_price,
+            shipping_carrier_id=shipping_carrier_id,
+            mail_class=mail_class,
+            min_delivery_days=min_delivery_days,
+            max_delivery_days=max_delivery_days,
+        )
         
-        data: Dict[str, Any] = {}
-        if upgrade_name is not None:
-            data["upgrade_name"] = upgrade_name
-        if upgrade_type is not None:
-            data["type"] = upgrade_type
-        if price is not None:
-            data["price"] = price
-        if secondary_price is not None:
-            data["secondary_price"] = secondary_price
-        if shipping_carrier_id is not None:
-            data["shipping_carrier_id"] = shipping_carrier_id
-        if mail_class is not None:
-            data["mail_class"] = mail_class
-        if min_delivery_days is not None:
-            data["min_delivery_days"] = min_delivery_days
-        if max_delivery_days is not None:
-            data["max_delivery_days"] = max_delivery_days
-        
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        # An empty payload would still cost a round trip and draw a 400.
+        if not data:
+            return {"noop": True}
+
+        result = await self._write("PUT", url, data)
+        self._invalidate_cached("get_shipping_profile_upgrades")
+        return result
     
     async def delete_shipping_profile_upgrade(
         self,
@@ -1354,15 +2465,47 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/shipping-profiles/{shipping_profile_id}/upgrades/{upgrade_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "upgrade_id": upgrade_id}
+        url = self._URL_SP_UPGRADE % (shop_id, shipping_profile_id, upgrade_id)
+        result = await self._delete_or_stub(url, "upgrade_id", upgrade_id)
+        self._invalidate_cached("get_shipping_profile_upgrades")
+        return result
     
     # Return Policy Methods
     
+    async def create_shipping_profile_upgrades_bulk(
+        self,
+        shop_id: str,
+        shipping_profile_id: str,
+        upgrades: list,
+        concurrency: int = 8
+    ) -> list:
+        """
+        Create several shipping upgrades on a profile concurrently.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            shipping_profile_id: The numeric ID of the shipping profile.
+            upgrades: List of keyword-argument dicts, one per call to
+                      create_shipping_profile_upgrade.
+            concurrency: Maximum requests in flight at once. Default is 8.
+
+        Returns:
+            List of per-upgrade results in input order; failed entries hold
+            the raised exception instead of a result dict.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def create(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with sem:
+                return await self.create_shipping_profile_upgrade(
+                    shop_id, shipping_profile_id, **item
+                )
+
+        return await asyncio.gather(
+            *[create(item) for item in upgrades], return_exceptions=True
+        )
+
+    @_async_ttl_cache(ttl=60.0)
     async def get_return_policies(
         self,
         shop_id: str
@@ -1379,11 +2522,10 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/policies/return"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_RETURN_POLICIES % shop_id
+        return await self._get_json(url)
     
+    @_async_ttl_cache(ttl=60.0)
     async def get_return_policy(
         self,
         shop_id: str,
@@ -1402,10 +2544,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/policies/return/{return_policy_id}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_RETURN_POLICY % (shop_id, return_policy_id)
+        return await self._get_json(url)
     
     async def create_return_policy(
         self,
@@ -1430,13 +2570,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/policies/return"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = self._URL_RETURN_POLICIES % shop_id
         data: Dict[str, Any] = {
             "accepts_returns": accepts_returns,
             "accepts_exchanges": accepts_exchanges
@@ -1445,9 +2579,9 @@ class EtsyClient:
         if return_deadline is not None:
             data["return_deadline"] = return_deadline
         
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        result = await self._write("POST", url, data)
+        self._invalidate_cached("get_return_policies", "get_return_policy")
+        return result
     
     async def update_return_policy(
         self,
@@ -1474,13 +2608,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/policies/return/{return_policy_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = self._URL_RETURN_POLICY % (shop_id, return_policy_id)
         data: Dict[str, Any] = {
             "accepts_returns": accepts_returns,
             "accepts_exchanges": accepts_exchanges
@@ -1489,9 +2617,9 @@ class EtsyClient:
         if return_deadline is not None:
             data["return_deadline"] = return_deadline
         
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        result = await self._write("PUT", url, data)
+        self._invalidate_cached("get_return_policies", "get_return_policy")
+        return result
     
     async def delete_return_policy(
         self,
@@ -1511,12 +2639,10 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/policies/return/{return_policy_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "return_policy_id": return_policy_id}
+        url = self._URL_RETURN_POLICY % (shop_id, return_policy_id)
+        result = await self._delete_or_stub(url, "return_policy_id", return_policy_id)
+        self._invalidate_cached("get_return_policies", "get_return_policy")
+        return result
     
     async def consolidate_return_policies(
         self,
@@ -1538,21 +2664,14 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/policies/return/consolidate"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
-        data = {
-            "source_return_policy_id": source_return_policy_id,
-            "destination_return_policy_id": destination_return_policy_id
-        }
-        
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_RETURN_CONSOLIDATE % shop_id
+        body = _CONSOLIDATE_BODY % (
+            str(source_return_policy_id).encode(),
+            str(destination_return_policy_id).encode(),
+        )
+        result = await self._write_encoded("POST", url, body)
+        self._invalidate_cached("get_return_policies", "get_return_policy")
+        return result
     
     # Shop Update Methods
     
@@ -1582,29 +2701,24 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        url = f"/application/shops/{shop_id}"
+        data: Dict[str, Any] = _p(
+            title=title,
+            announcement=announcement,
+            sale_message=sale_message,
+            digital_sale_message=digital_sale_message,
+            policy_additional=policy_additional,
+        )
         
-        data: Dict[str, Any] = {}
-        if title is not None:
-            data["title"] = title
-        if announcement is not None:
-            data["announcement"] = announcement
-        if sale_message is not None:
-            data["sale_message"] = sale_message
-        if digital_sale_message is not None:
-            data["digital_sale_message"] = digital_sale_message
-        if policy_additional is not None:
-            data["policy_additional"] = policy_additional
-        
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        # An empty payload would still cost a round trip and draw a 400.
+        if not data:
+            return {"noop": True}
+
+        result = await self._write("PUT", url, data)
+        self._invalidate_cached("get_shop")
+        return result
     
+    @_async_ttl_cache(ttl=60.0)
     async def get_holiday_preferences(
         self,
         shop_id: str
@@ -1621,10 +2735,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/holiday-preferences"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_HOLIDAY_PREFS % shop_id
+        return await self._get_json(url)
     
     async def update_holiday_preference(
         self,
@@ -1646,19 +2758,43 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/holiday-preferences/{holiday_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
-        data = {"is_working": is_working}
-        
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        url = self._URL_HOLIDAY_PREF % (shop_id, holiday_id)
+        body = _IS_WORKING_TRUE if is_working else _IS_WORKING_FALSE
+        result = await self._write_encoded("PUT", url, body)
+        self._invalidate_cached("get_holiday_preferences")
+        return result
     
+    async def update_holiday_preferences_bulk(
+        self,
+        shop_id: str,
+        preferences: Dict[str, bool],
+        concurrency: int = 8
+    ) -> list:
+        """
+        Update several holiday preferences concurrently.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            preferences: Mapping of holiday_id to is_working.
+            concurrency: Maximum requests in flight at once. Default is 8.
+
+        Returns:
+            List of per-holiday results in mapping order; failed entries
+            hold the raised exception instead of a result dict.
+        """
+        sem = asyncio.Semaphore(concurrency)
+
+        async def update(holiday_id: str, is_working: bool) -> Dict[str, Any]:
+            async with sem:
+                return await self.update_holiday_preference(
+                    shop_id, holiday_id, is_working
+                )
+
+        return await asyncio.gather(
+            *[update(h, w) for h, w in preferences.items()],
+            return_exceptions=True,
+        )
+
     # Receipt Management Methods
     
     async def get_shop_receipts(
@@ -1701,7 +2837,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/receipts"
+        url = f"/application/shops/{shop_id}/receipts"
         params: Dict[str, Any] = {
             "limit": limit,
             "offset": offset,
@@ -1709,27 +2845,69 @@ class EtsyClient:
             "sort_order": sort_order
         }
         
-        if min_created is not None:
-            params["min_created"] = min_created
-        if max_created is not None:
-            params["max_created"] = max_created
-        if min_last_modified is not None:
-            params["min_last_modified"] = min_last_modified
-        if max_last_modified is not None:
-            params["max_last_modified"] = max_last_modified
-        if was_paid is not None:
-            params["was_paid"] = was_paid
-        if was_shipped is not None:
-            params["was_shipped"] = was_shipped
-        if was_delivered is not None:
-            params["was_delivered"] = was_delivered
-        if was_canceled is not None:
-            params["was_canceled"] = was_canceled
-        
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        params.update(_p(
+            min_created=min_created,
+            max_created=max_created,
+            min_last_modified=min_last_modified,
+            max_last_modified=max_last_modified,
+            was_paid=was_paid,
+            was_shipped=was_shipped,
+            was_delivered=was_delivered,
+            was_canceled=was_canceled,
+        ))
+        
+        return await self._get_json(url, params)
     
+    async def get_all_shop_receipts(
+        self,
+        shop_id: str,
+        page_size: int = 100,
+        concurrency: int = 8,
+        **filters
+    ) -> list:
+        """
+        Fetch every receipt matching the filters, paginating concurrently.
+
+        The first page reveals the total count; the remaining pages are
+        fetched in parallel under a semaphore, like the listing and review
+        crawlers.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            page_size: Receipts per page (max 100). Default is 100.
+            concurrency: Maximum pages in flight at once. Default is 8.
+            **filters: Optional keyword filters passed to get_shop_receipts
+                       (min_created, was_paid, sort_on, ...).
+
+        Returns:
+            List of all receipt dictionaries.
+
+        Raises:
+            httpx.HTTPError: If any page request fails.
+        """
+        first = await self.get_shop_receipts(
+            shop_id, limit=page_size, offset=0, **filters
+        )
+        total = first.get("count", 0)
+        results = list(first.get("results") or [])
+        if total <= page_size:
+            return results
+
+        sem = asyncio.Semaphore(concurrency)
+
+        async def fetch(offset: int) -> Dict[str, Any]:
+            async with sem:
+                return await self.get_shop_receipts(
+                    shop_id, limit=page_size, offset=offset, **filters
+                )
+
+        pages = await asyncio.gather(*[
+            fetch(offset) for offset in range(page_size, total, page_size)
+        ])
+        for page in pages:
+            results.extend(page.get("results") or [])
+        return results
+
     async def get_shop_receipt(
         self,
         shop_id: str,
@@ -1748,10 +2926,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/receipts/{receipt_id}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/receipts/{receipt_id}"
+        return await self._get_json(url)
     
     async def update_shop_receipt(
         self,
@@ -1775,22 +2951,14 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/receipts/{receipt_id}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
-        data: Dict[str, Any] = {}
-        if was_shipped is not None:
-            data["was_shipped"] = was_shipped
-        if was_paid is not None:
-            data["was_paid"] = was_paid
+        url = f"/application/shops/{shop_id}/receipts/{receipt_id}"
+        data: Dict[str, Any] = _p(was_shipped=was_shipped, was_paid=was_paid)
         
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        # An empty payload would still cost a round trip and draw a 400.
+        if not data:
+            return {"noop": True}
+
+        return await self._write("PUT", url, data)
     
     async def create_receipt_shipment(
         self,
@@ -1818,26 +2986,14 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/receipts/{receipt_id}/tracking"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
-        data: Dict[str, Any] = {}
-        if tracking_code is not None:
-            data["tracking_code"] = tracking_code
-        if carrier_name is not None:
-            data["carrier_name"] = carrier_name
+        url = f"/application/shops/{shop_id}/receipts/{receipt_id}/tracking"
+        data: Dict[str, Any] = _p(tracking_code=tracking_code, carrier_name=carrier_name)
         if send_bcc:
             data["send_bcc"] = send_bcc
         if note_to_buyer is not None:
             data["note_to_buyer"] = note_to_buyer
         
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        return await self._write("POST", url, data)
     
     # Transaction Methods
     
@@ -1861,14 +3017,12 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/transactions"
+        url = f"/application/shops/{shop_id}/transactions"
         params = {
             "limit": limit,
             "offset": offset
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
     async def get_receipt_transactions(
         self,
@@ -1888,10 +3042,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/receipts/{receipt_id}/transactions"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/receipts/{receipt_id}/transactions"
+        return await self._get_json(url)
     
     async def get_listing_transactions(
         self,
@@ -1915,14 +3067,12 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/transactions"
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/transactions"
         params = {
             "limit": limit,
             "offset": offset
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
     # Listing Creation Methods
     
@@ -1959,13 +3109,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = f"/application/shops/{shop_id}/listings"
         data: Dict[str, Any] = {
             "quantity": quantity,
             "title": title,
@@ -1981,9 +3125,7 @@ class EtsyClient:
             if value is not None:
                 data[key] = value
         
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        return await self._write("POST", url, data)
     
     # Listing Image Methods
     
@@ -2003,10 +3145,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}/images"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/listings/{listing_id}/images"
+        return await self._get_json(url)
     
     async def upload_listing_image(
         self,
@@ -2039,11 +3179,8 @@ class EtsyClient:
         import mimetypes
         from pathlib import Path
         
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/images"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-        }
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/images"
+        headers = self._headers_auth
         
         # Read image file
         image_file = Path(image_path)
@@ -2066,8 +3203,7 @@ class EtsyClient:
             data["alt_text"] = alt_text
         
         response = await self.async_client.post(url, headers=headers, files=files, data=data)
-        response.raise_for_status()
-        return response.json()
+        return _parse(response)
     
     async def delete_listing_image(
         self,
@@ -2089,12 +3225,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/images/{listing_image_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "listing_image_id": listing_image_id}
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/images/{listing_image_id}"
+        return await self._delete_or_stub(url, "listing_image_id", listing_image_id)
     
     async def update_variation_images(
         self,
@@ -2116,18 +3248,13 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/variation-images"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/variation-images"
+        headers = self._headers_json
         
         payload = {"variation_images": variation_images}
         
         response = await self.async_client.post(url, headers=headers, json=payload)
-        response.raise_for_status()
-        return response.json()
+        return _parse(response)
     
     # Inventory Update Methods
     
@@ -2157,34 +3284,28 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}/inventory"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/json",
-        }
+        url = f"/application/listings/{listing_id}/inventory"
+        headers = self._headers_json
         
         payload: Dict[str, Any] = {"products": products}
         
-        if price_on_property is not None:
-            payload["price_on_property"] = price_on_property
-        if quantity_on_property is not None:
-            payload["quantity_on_property"] = quantity_on_property
-        if sku_on_property is not None:
-            payload["sku_on_property"] = sku_on_property
-        if readiness_state_on_property is not None:
-            payload["readiness_state_on_property"] = readiness_state_on_property
+        payload.update(_p(
+            price_on_property=price_on_property,
+            quantity_on_property=quantity_on_property,
+            sku_on_property=sku_on_property,
+            readiness_state_on_property=readiness_state_on_property,
+        ))
         
         response = await self.async_client.put(url, headers=headers, json=payload)
         if response.status_code >= 400:
             # Try to get error details from response body
             try:
-                error_data = response.json()
+                error_data = orjson.loads(response.content)
                 error_msg = f"Etsy API error: {error_data}"
             except:
                 error_msg = f"HTTP {response.status_code}: {response.text}"
             raise Exception(error_msg)
-        return response.json()
+        return orjson.loads(response.content)
     
     # Listing File Methods (Digital Products)
     
@@ -2204,10 +3325,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}/files"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/listings/{listing_id}/files"
+        return await self._get_json(url)
     
     async def get_listing_file(
         self,
@@ -2229,10 +3348,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/files/{listing_file_id}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/files/{listing_file_id}"
+        return await self._get_json(url)
     
     async def upload_listing_file(
         self,
@@ -2261,11 +3378,8 @@ class EtsyClient:
         import mimetypes
         from pathlib import Path
         
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/files"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-        }
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/files"
+        headers = self._headers_auth
         
         file_obj = Path(file_path)
         mime_type = mimetypes.guess_type(file_path)[0] or "application/octet-stream"
@@ -2280,8 +3394,7 @@ class EtsyClient:
             data["name"] = name
         
         response = await self.async_client.post(url, headers=headers, files=files, data=data)
-        response.raise_for_status()
-        return response.json()
+        return _parse(response)
     
     async def delete_listing_file(
         self,
@@ -2303,12 +3416,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/files/{listing_file_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "listing_file_id": listing_file_id}
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/files/{listing_file_id}"
+        return await self._delete_or_stub(url, "listing_file_id", listing_file_id)
     
     # Listing Video Methods
     
@@ -2328,10 +3437,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}/videos"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/listings/{listing_id}/videos"
+        return await self._get_json(url)
     
     async def get_listing_video(
         self,
@@ -2351,10 +3458,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/listings/{listing_id}/videos/{video_id}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/listings/{listing_id}/videos/{video_id}"
+        return await self._get_json(url)
     
     async def upload_listing_video(
         self,
@@ -2381,11 +3486,8 @@ class EtsyClient:
         import mimetypes
         from pathlib import Path
         
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/videos"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-        }
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/videos"
+        headers = self._headers_auth
         
         video_obj = Path(video_path)
         mime_type = mimetypes.guess_type(video_path)[0] or "video/mp4"
@@ -2400,8 +3502,7 @@ class EtsyClient:
             data["name"] = name
         
         response = await self.async_client.post(url, headers=headers, files=files, data=data)
-        response.raise_for_status()
-        return response.json()
+        return _parse(response)
     
     async def delete_listing_video(
         self,
@@ -2423,12 +3524,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/videos/{video_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "video_id": video_id}
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/videos/{video_id}"
+        return await self._delete_or_stub(url, "video_id", video_id)
     
     # Listing Translation Methods
     
@@ -2458,13 +3555,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/translations/{language}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/translations/{language}"
         data: Dict[str, Any] = {
             "title": title,
             "description": description
@@ -2473,9 +3564,7 @@ class EtsyClient:
         if tags is not None:
             data["tags"] = tags
         
-        response = await self.async_client.post(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        return await self._write("POST", url, data)
     
     async def get_listing_translation(
         self,
@@ -2497,10 +3586,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/translations/{language}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/translations/{language}"
+        return await self._get_json(url)
     
     async def update_listing_translation(
         self,
@@ -2528,13 +3615,7 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/{listing_id}/translations/{language}"
-        headers = {
-            "x-api-key": self.api_key,
-            "Authorization": f"Bearer {self.access_token}",
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
-        
+        url = f"/application/shops/{shop_id}/listings/{listing_id}/translations/{language}"
         data: Dict[str, Any] = {
             "title": title,
             "description": description
@@ -2543,9 +3624,7 @@ class EtsyClient:
         if tags is not None:
             data["tags"] = tags
         
-        response = await self.async_client.put(url, headers=headers, data=data)
-        response.raise_for_status()
-        return response.json()
+        return await self._write("PUT", url, data)
     
     # Taxonomy Methods
     
@@ -2559,10 +3638,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/buyer-taxonomy/nodes"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = "/application/buyer-taxonomy/nodes"
+        return await self._get_json(url)
     
     async def get_buyer_taxonomy_properties(
         self,
@@ -2580,10 +3657,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/buyer-taxonomy/nodes/{taxonomy_id}/properties"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/buyer-taxonomy/nodes/{taxonomy_id}/properties"
+        return await self._get_json(url)
     
     async def get_seller_taxonomy(self) -> Dict[str, Any]:
         """
@@ -2595,10 +3670,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/seller-taxonomy/nodes"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = "/application/seller-taxonomy/nodes"
+        return await self._get_json(url)
     
     async def get_seller_taxonomy_properties(
         self,
@@ -2616,10 +3689,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/seller-taxonomy/nodes/{taxonomy_id}/properties"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/seller-taxonomy/nodes/{taxonomy_id}/properties"
+        return await self._get_json(url)
     
     # Featured Listings Methods
     
@@ -2643,14 +3714,12 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/listings/featured"
+        url = f"/application/shops/{shop_id}/listings/featured"
         params = {
             "limit": limit,
             "offset": offset
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
     # Production Partners Methods
     
@@ -2670,10 +3739,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/shops/{shop_id}/production-partners"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/shops/{shop_id}/production-partners"
+        return await self._get_json(url)
     
     # User Address Methods
     
@@ -2695,14 +3762,12 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/user/addresses"
+        url = "/application/user/addresses"
         params = {
             "limit": limit,
             "offset": offset
         }
-        response = await self.async_client.get(url, headers=self._get_headers(), params=params)
-        response.raise_for_status()
-        return response.json()
+        return await self._get_json(url, params)
     
     async def get_user_address(
         self,
@@ -2720,10 +3785,8 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/user/addresses/{user_address_id}"
-        response = await self.async_client.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        url = f"/application/user/addresses/{user_address_id}"
+        return await self._get_json(url)
     
     async def delete_user_address(
         self,
@@ -2741,42 +3804,43 @@ class EtsyClient:
         Raises:
             httpx.HTTPError: If the API request fails.
         """
-        url = f"{self.BASE_URL}/application/user/addresses/{user_address_id}"
-        response = await self.async_client.delete(url, headers=self._get_headers())
-        response.raise_for_status()
-        if response.text:
-            return response.json()
-        return {"deleted": True, "user_address_id": user_address_id}
-    
-    async def close(self):
-        """Close the HTTP clients."""
-        self.client.close()
-        await self.async_client.aclose()
-    
-    def __enter__(self):
-        """Context manager entry."""
-        return self
+        url = f"/application/user/addresses/{user_address_id}"
+        return await self._delete_or_stub(url, "user_address_id", user_address_id)
     
+    def shipping_profile_session(
+        self,
+        shop_id: str,
+        shipping_profile_id: str,
+        concurrency: int = 8
+    ) -> _ShippingProfileSession:
+        """
+        Open a buffered write session for a shipping profile.
+
+        Queued destination/upgrade writes are flushed concurrently when the
+        session exits (or on an explicit flush()), overlapping their round
+        trips instead of awaiting each in turn.
+
+        Args:
+            shop_id: The unique identifier for the shop.
+            shipping_profile_id: The numeric ID of the shipping profile.
+            concurrency: Maximum writes in flight per flush. Default is 8.
+
+        Returns:
+            A _ShippingProfileSession usable as an async context manager.
+        """
+        return _ShippingProfileSession(
+            self, shop_id, shipping_profile_id, concurrency
+        )
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Async context manager exit."""
-        await self.close()
-    
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        # For sync context manager, need to run async close
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # In async context, schedule cleanup
-                asyncio.create_task(self.close())
-            else:
-                # In sync context, run it
-                loop.run_until_complete(self.close())
-        except Exception:
-            # Fallback: just close sync client
-            self.client.close()
+        """Async context manager exit.
+
+        The shared async client stays open so its connection pool survives;
+        use aclose_shared_client() at application shutdown.
+        """
+        return None
 
@@ -11,6 +11,8 @@ import httpx
 from typing import Optional, Dict, Any
 from datetime import datetime, timedelta
 
+from etsy_client import get_shared_async_client
+
 
 class OAuthManager:
     """Manages OAuth 2.0 flow with PKCE for Etsy API."""
@@ -107,34 +109,34 @@ class OAuthManager:
         Raises:
             httpx.HTTPError: If token exchange fails
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "grant_type": "authorization_code",
-                    "client_id": self.api_key,
-                    "redirect_uri": self.redirect_uri,
-                    "code": code,
-                    "code_verifier": code_verifier
-                },
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded"
-                }
-            )
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Calculate expiration time
-            expires_in = data.get("expires_in", 3600)  # Default 1 hour
-            expires_at = (datetime.utcnow() + timedelta(seconds=expires_in)).isoformat()
-            
-            return {
-                "access_token": data["access_token"],
-                "expires_at": expires_at,
-                "token_type": data.get("token_type", "Bearer"),
-                "refresh_token": data.get("refresh_token")
+        client = get_shared_async_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            data={
+                "grant_type": "authorization_code",
+                "client_id": self.api_key,
+                "redirect_uri": self.redirect_uri,
+                "code": code,
+                "code_verifier": code_verifier
+            },
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded"
             }
+        )
+        response.raise_for_status()
+
+        data = response.json()
+
+        # Calculate expiration time
+        expires_in = data.get("expires_in", 3600)  # Default 1 hour
+        expires_at = (datetime.utcnow() + timedelta(seconds=expires_in)).isoformat()
+
+        return {
+            "access_token": data["access_token"],
+            "expires_at": expires_at,
+            "token_type": data.get("token_type", "Bearer"),
+            "refresh_token": data.get("refresh_token")
+        }
 
     async def refresh_access_token(self, refresh_token: str) -> Dict[str, Any]:
         """
@@ -150,28 +152,28 @@ class OAuthManager:
             - token_type
             - refresh_token (may be rotated by server)
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                self.TOKEN_URL,
-                data={
-                    "grant_type": "refresh_token",
-                    "client_id": self.api_key,
-                    "refresh_token": refresh_token,
-                },
-                headers={
-                    "Content-Type": "application/x-www-form-urlencoded"
-                }
-            )
-            response.raise_for_status()
-            data = response.json()
+        client = get_shared_async_client()
+        response = await client.post(
+            self.TOKEN_URL,
+            data={
+                "grant_type": "refresh_token",
+                "client_id": self.api_key,
+                "refresh_token": refresh_token,
+            },
+            headers={
+                "Content-Type": "application/x-www-form-urlencoded"
+            }
+        )
+        response.raise_for_status()
+        data = response.json()
 
-            expires_in = data.get("expires_in", 3600)
-            expires_at = (datetime.utcnow() + timedelta(seconds=expires_in)).isoformat()
+        expires_in = data.get("expires_in", 3600)
+        expires_at = (datetime.utcnow() + timedelta(seconds=expires_in)).isoformat()
 
-            return {
-                "access_token": data["access_token"],
-                "expires_at": expires_at,
-                "token_type": data.get("token_type", "Bearer"),
-                "refresh_token": data.get("refresh_token", refresh_token),
-            }
+        return {
+            "access_token": data["access_token"],
+            "expires_at": expires_at,
+            "token_type": data.get("token_type", "Bearer"),
+            "refresh_token": data.get("refresh_token", refresh_token),
+        }
 
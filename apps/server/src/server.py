@@ -238,7 +238,7 @@ async def connect_etsy() -> dict:
         
         # Start callback server
         callback_server = OAuthCallbackServer()
-        callback_server.start()
+        await callback_server.start()
         
         print(f"\n{'='*60}")
         print("ETSY AUTHORIZATION REQUIRED")
@@ -253,7 +253,7 @@ async def connect_etsy() -> dict:
         
         # Wait for callback
         try:
-            callback_data = callback_server.wait_for_callback(timeout=300)
+            callback_data = await callback_server.wait_for_callback(timeout=300)
         finally:
             callback_server.stop()
         
@@ -5118,6 +5118,13 @@ async def delete_user_address(user_address_id: int) -> dict:
 
 
 if __name__ == "__main__":
+    # uvloop cuts event-loop overhead for the many small Etsy calls the
+    # tools issue; fall back silently to the stock loop where unavailable.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     # Run the MCP server
     _schedule_session_restore()
     mcp.run()